@@ -11,7 +11,7 @@ from pathlib import PurePath
 from internal_plugins.test_lockfile_fixtures.lockfile_fixture import JVMLockfileFixtureDefinition
 from pants.backend.python.subsystems.pytest import PyTest
 from pants.backend.python.subsystems.setup import PythonSetup
-from pants.backend.python.target_types import EntryPoint
+from pants.backend.python.target_types import EntryPoint, PythonSourceField
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex import (
     PexRequest,
@@ -29,7 +29,7 @@ from pants.core.goals.test import TestExtraEnv
 from pants.core.util_rules.config_files import find_config_file
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
-from pants.engine.fs import CreateDigest, FileContent, Workspace
+from pants.engine.fs import CreateDigest, Digest, FileContent, Workspace
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.graph import transitive_targets as transitive_targets_get
 from pants.engine.internals.native_engine import MergeDigests
@@ -44,24 +44,28 @@ from pants.engine.process import ProcessCacheScope, fallible_to_exec_result_or_r
 from pants.engine.rules import collect_rules, goal_rule, implicitly, rule
 from pants.engine.target import Targets, TransitiveTargetsRequest
 from pants.jvm.resolve.common import ArtifactRequirement, ArtifactRequirements
+from pants.jvm.resolve.coordinate import Coordinate
 from pants.jvm.resolve.coursier_fetch import coursier_resolve_lockfile
 from pants.jvm.resolve.lockfile_metadata import JVMLockfileMetadata
-from pants.util.dirutil import group_by_dir
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JVMLockfileFixtureConfig:
     definition: JVMLockfileFixtureDefinition
     test_file_path: str
 
+    @property
+    def lockfile_path(self) -> str:
+        return str(PurePath(self.test_file_path).parent / self.definition.lockfile_rel_path)
+
 
 class CollectedJVMLockfileFixtureConfigs(DeduplicatedCollection[JVMLockfileFixtureConfig]):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RenderedJVMLockfileFixture:
     content: bytes
     path: str
@@ -71,6 +75,26 @@ class RenderedJVMLockfileFixtures(DeduplicatedCollection[RenderedJVMLockfileFixt
     pass
 
 
+@dataclass(frozen=True)
+class CollectFixturesScript:
+    digest: Digest
+    path: str
+
+
+@rule
+async def setup_collect_fixtures_script() -> CollectFixturesScript:
+    script_content_bytes = pkgutil.get_data(__name__, "collect_fixtures.py")
+    if not script_content_bytes:
+        raise AssertionError("Did not find collect_fixtures.py script as resouce.")
+    script_content = FileContent(
+        path="collect_fixtures.py",
+        content=script_content_bytes,
+        is_executable=True,
+    )
+    script_digest = await create_digest(CreateDigest([script_content]))
+    return CollectFixturesScript(script_digest, script_content.path)
+
+
 # TODO: This rule was mostly copied from the rule `setup_pytest_for_target` in
 # `src/python/pants/backend/python/goals/pytest_runner.py`. Some refactoring should be done.
 @rule
@@ -88,33 +112,23 @@ async def collect_fixture_configs(
 
     interpreter_constraints = InterpreterConstraints.create_from_targets(all_targets, python_setup)
 
-    pytest_pex, requirements_pex, prepared_sources, root_sources = await concurrently(
+    pytest_pex, requirements_pex, prepared_sources, collect_fixtures_script = await concurrently(
         create_pex(pytest.to_pex_request(interpreter_constraints=interpreter_constraints)),
         create_pex(**implicitly(RequirementsPexRequest(addresses))),
         prepare_python_sources(
             PythonSourceFilesRequest(all_targets, include_files=True, include_resources=True),
             **implicitly(),
         ),
-        prepare_python_sources(PythonSourceFilesRequest(targets), **implicitly()),
+        setup_collect_fixtures_script(),
     )
 
-    script_content_bytes = pkgutil.get_data(__name__, "collect_fixtures.py")
-    if not script_content_bytes:
-        raise AssertionError("Did not find collect_fixtures.py script as resouce.")
-    script_content = FileContent(
-        path="collect_fixtures.py",
-        content=script_content_bytes,
-        is_executable=True,
-    )
-    script_digest = await create_digest(CreateDigest([script_content]))
-
     pytest_runner_pex_get = create_venv_pex(
         **implicitly(
             PexRequest(
                 output_filename="pytest_runner.pex",
                 interpreter_constraints=interpreter_constraints,
-                main=EntryPoint(PurePath(script_content.path).stem),
-                sources=script_digest,
+                main=EntryPoint(PurePath(collect_fixtures_script.path).stem),
+                sources=collect_fixtures_script.digest,
                 internal_only=True,
                 pex_path=[
                     pytest_pex,
@@ -123,7 +137,9 @@ async def collect_fixture_configs(
             )
         )
     )
-    config_file_dirs = list(group_by_dir(prepared_sources.source_files.files).keys())
+    config_file_dirs = list(
+        dict.fromkeys(os.path.dirname(path) for path in prepared_sources.source_files.files)
+    )
     config_files_get = find_config_file(pytest.config_request(config_file_dirs))
     pytest_runner_pex, config_files = await concurrently(pytest_runner_pex_get, config_files_get)
 
@@ -138,15 +154,21 @@ async def collect_fixture_configs(
         )
     )
 
-    extra_env = {
-        "PEX_EXTRA_SYS_PATH": ":".join(prepared_sources.source_roots),
-        **test_extra_env.env,
-    }
+    extra_env = {"PEX_EXTRA_SYS_PATH": ":".join(prepared_sources.source_roots)}
+    extra_env.update(test_extra_env.env)
+
+    # The root targets are a subset of the transitive closure, so their files are already part of
+    # the prepared sources and can be taken straight from their source fields.
+    root_test_files = sorted(
+        tgt[PythonSourceField].file_path
+        for tgt in targets
+        if tgt.has_field(PythonSourceField) and tgt[PythonSourceField].file_path.endswith(".py")
+    )
 
     process = await setup_venv_pex_process(
         VenvPexProcess(
             pytest_runner_pex,
-            argv=[name for name in root_sources.source_files.files if name.endswith(".py")],
+            argv=root_test_files,
             extra_env=extra_env,
             input_digest=input_digest,
             output_files=("tests.json",),
@@ -159,48 +181,53 @@ async def collect_fixture_configs(
 
     result = await fallible_to_exec_result_or_raise(**implicitly(process))
     digest_contents = await get_digest_contents(result.output_digest)
-    assert len(digest_contents) == 1
-    assert digest_contents[0].path == "tests.json"
-    raw_config_data = json.loads(digest_contents[0].content)
+    assert len(digest_contents) == 1 and digest_contents[0].path == "tests.json", (
+        f"Expected only tests.json to be collected, got: {[fc.path for fc in digest_contents]}"
+    )
 
-    configs = []
-    for item in raw_config_data:
-        config = JVMLockfileFixtureConfig(
+    return CollectedJVMLockfileFixtureConfigs(
+        JVMLockfileFixtureConfig(
             definition=JVMLockfileFixtureDefinition.from_json_dict(item),
             test_file_path=item["test_file_path"],
         )
-        configs.append(config)
-
-    return CollectedJVMLockfileFixtureConfigs(configs)
+        for item in json.loads(digest_contents[0].content)
+    )
 
 
 @rule
 async def gather_lockfile_fixtures(
     configs: CollectedJVMLockfileFixtureConfigs,
 ) -> RenderedJVMLockfileFixtures:
-    rendered_fixtures = []
-    for config in configs:
-        artifact_reqs = ArtifactRequirements(
-            [ArtifactRequirement(coordinate) for coordinate in config.definition.requirements]
-        )
-        lockfile = await coursier_resolve_lockfile(artifact_reqs)
-        serialized_lockfile = JVMLockfileMetadata.new(artifact_reqs).add_header_to_lockfile(
+    if not configs:
+        return RenderedJVMLockfileFixtures()
+
+    # Fixtures frequently share the same requirements, so only resolve each distinct set once.
+    keyed_configs = [(config, frozenset(config.definition.requirements)) for config in configs]
+    artifact_reqs_by_key: dict[frozenset[Coordinate], ArtifactRequirements] = {}
+    for config, key in keyed_configs:
+        if key not in artifact_reqs_by_key:
+            artifact_reqs_by_key[key] = ArtifactRequirements(
+                [ArtifactRequirement(coordinate) for coordinate in config.definition.requirements]
+            )
+    lockfiles = await concurrently(
+        coursier_resolve_lockfile(artifact_reqs) for artifact_reqs in artifact_reqs_by_key.values()
+    )
+    serialized_lockfiles = {
+        key: JVMLockfileMetadata.new(artifact_reqs).add_header_to_lockfile(
             lockfile.to_serialized(),
             regenerate_command=f"{bin_name()} {InternalGenerateTestLockfileFixturesSubsystem.name} ::",
             delimeter="#",
         )
+        for (key, artifact_reqs), lockfile in zip(artifact_reqs_by_key.items(), lockfiles)
+    }
 
-        lockfile_path = os.path.join(
-            os.path.dirname(config.test_file_path), config.definition.lockfile_rel_path
+    return RenderedJVMLockfileFixtures(
+        RenderedJVMLockfileFixture(
+            content=serialized_lockfiles[key],
+            path=config.lockfile_path,
         )
-        rendered_fixtures.append(
-            RenderedJVMLockfileFixture(
-                content=serialized_lockfile,
-                path=lockfile_path,
-            )
-        )
-
-    return RenderedJVMLockfileFixtures(rendered_fixtures)
+        for config, key in keyed_configs
+    )
 
 
 class InternalGenerateTestLockfileFixturesSubsystem(GoalSubsystem):
@@ -223,11 +250,12 @@ async def internal_render_test_lockfile_fixtures(
         console.write_stdout("No test lockfile fixtures found.\n")
         return InternalGenerateTestLockfileFixturesGoal(exit_code=0)
 
-    digest_contents = [
+    # Create the digest in a canonical order so that the request is stable across runs.
+    create_digest_request = CreateDigest(
         FileContent(rendered_fixture.path, rendered_fixture.content)
-        for rendered_fixture in rendered_fixtures
-    ]
-    snapshot = await digest_to_snapshot(**implicitly(CreateDigest(digest_contents)))
+        for rendered_fixture in sorted(rendered_fixtures, key=lambda fixture: fixture.path)
+    )
+    snapshot = await digest_to_snapshot(**implicitly(create_digest_request))
     console.write_stdout(f"Writing test lockfile fixtures: {snapshot.files}\n")
     workspace.write_digest(snapshot.digest)
     return InternalGenerateTestLockfileFixturesGoal(exit_code=0)
@@ -17,6 +17,33 @@ from pants.engine.rules import QueryRule
 from pants.testutil.rule_runner import RuleRunner
 
 
+_BUILD_SCRIPTS_BUILD = """\
+package_json(
+    scripts=[
+        node_build_script(entry_point="build", output_directories=["dist"]),
+        node_build_script(entry_point="compile", output_directories=["dist"]),
+        node_build_script(entry_point="transpile", output_directories=["dist"]),
+    ]
+)
+"""
+_BUILD_SCRIPTS_PACKAGE_JSON = {
+    "name": "ham",
+    "version": "0.0.1",
+    "browser": "lib/index.mjs",
+    "scripts": {
+        "build": "swc ./lib -d dist",
+        "transpile": "babel ./lib -d dist",
+        "compile": "tsc ./lib --emit -d bin",
+    },
+}
+_BUILD_SCRIPTS_NPM_PACKAGE_JSON = json.dumps(_BUILD_SCRIPTS_PACKAGE_JSON)
+_BUILD_SCRIPTS_YARN_PACKAGE_JSON = json.dumps(
+    {**_BUILD_SCRIPTS_PACKAGE_JSON, "packageManager": "yarn@1.22.19"}
+)
+_EMPTY_PACKAGE_LOCK = json.dumps({})
+_LIB_BUILD = "javascript_sources()\n"
+
+
 @pytest.fixture
 def rule_runner() -> RuleRunner:
     rule_runner = RuleRunner(
@@ -39,35 +66,10 @@ def rule_runner() -> RuleRunner:
 def test_creates_npm_run_requests_package_json_scripts(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
-            "src/js/BUILD": dedent(
-                """\
-                package_json(
-                    scripts=[
-                        node_build_script(entry_point="build", output_directories=["dist"]),
-                        node_build_script(entry_point="compile", output_directories=["dist"]),
-                        node_build_script(entry_point="transpile", output_directories=["dist"]),
-                    ]
-                )
-                """
-            ),
-            "src/js/package.json": json.dumps(
-                {
-                    "name": "ham",
-                    "version": "0.0.1",
-                    "browser": "lib/index.mjs",
-                    "scripts": {
-                        "build": "swc ./lib -d dist",
-                        "transpile": "babel ./lib -d dist",
-                        "compile": "tsc ./lib --emit -d bin",
-                    },
-                }
-            ),
-            "src/js/package-lock.json": json.dumps({}),
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/BUILD": _BUILD_SCRIPTS_BUILD,
+            "src/js/package.json": _BUILD_SCRIPTS_NPM_PACKAGE_JSON,
+            "src/js/package-lock.json": _EMPTY_PACKAGE_LOCK,
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )
@@ -81,36 +83,10 @@ def test_creates_npm_run_requests_package_json_scripts(rule_runner: RuleRunner)
 def test_creates_yarn_run_requests_package_json_scripts(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
-            "src/js/BUILD": dedent(
-                """\
-                package_json(
-                    scripts=[
-                        node_build_script(entry_point="build", output_directories=["dist"]),
-                        node_build_script(entry_point="compile", output_directories=["dist"]),
-                        node_build_script(entry_point="transpile", output_directories=["dist"]),
-                    ]
-                )
-                """
-            ),
-            "src/js/package.json": json.dumps(
-                {
-                    "name": "ham",
-                    "version": "0.0.1",
-                    "browser": "lib/index.mjs",
-                    "scripts": {
-                        "build": "swc ./lib -d dist",
-                        "transpile": "babel ./lib -d dist",
-                        "compile": "tsc ./lib --emit -d bin",
-                    },
-                    "packageManager": "yarn@1.22.19",
-                }
-            ),
+            "src/js/BUILD": _BUILD_SCRIPTS_BUILD,
+            "src/js/package.json": _BUILD_SCRIPTS_YARN_PACKAGE_JSON,
             "src/js/yarn.lock": "",
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )
@@ -148,12 +124,8 @@ def test_extra_envs(rule_runner: RuleRunner) -> None:
                     "scripts": {"build": "mkdir dist && echo $FOO >> dist/index.cjs"},
                 }
             ),
-            "src/js/package-lock.json": json.dumps({}),
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/package-lock.json": _EMPTY_PACKAGE_LOCK,
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )
@@ -185,12 +157,8 @@ def test_run_node_script(rule_runner: RuleRunner) -> None:
                     "scripts": {"start": "node server.js"},
                 }
             ),
-            "src/js/package-lock.json": json.dumps({}),
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/package-lock.json": _EMPTY_PACKAGE_LOCK,
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )
@@ -238,11 +206,7 @@ def test_pnpm_run_node_script_propagates_append_only_caches(rule_runner: RuleRun
                 snapshots: {}
                 """
             ),
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )
@@ -288,11 +252,7 @@ def test_yarn_run_node_script_propagates_append_only_caches(rule_runner: RuleRun
 
                 """
             ),
-            "src/js/lib/BUILD": dedent(
-                """\
-                javascript_sources()
-                """
-            ),
+            "src/js/lib/BUILD": _LIB_BUILD,
             "src/js/lib/index.mjs": "",
         }
     )